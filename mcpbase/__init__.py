@@ -14,6 +14,14 @@ __version__ = "1.0.0"
 __author__ = "MCPBase Team"
 __license__ = "MIT"
 
-from .server import MCPBaseServer
+__all__ = ["MCPBaseServer"]
 
-__all__ = ["MCPBaseServer"]
\ No newline at end of file
+
+def __getattr__(name: str):
+    """Import the server (and its MCP backend) only when first accessed (PEP 562)."""
+    if name == "MCPBaseServer":
+        from .server import MCPBaseServer
+        globals()[name] = MCPBaseServer
+        return MCPBaseServer
+    
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
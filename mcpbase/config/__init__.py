@@ -6,31 +6,97 @@ Contains all configuration constants, settings, and environment variables
 for the MCP server. Uses python-dotenv to load from .env file.
 """
 
+from __future__ import annotations
+
 import os
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Any, NamedTuple
 from datetime import datetime
 
-try:
-    from dotenv import load_dotenv
-    load_dotenv()  # Load .env file
-except ImportError:
-    pass  # dotenv not available, use environment variables directly
+# Lowercase values treated as "true" for boolean settings
+_BOOL_TRUE = frozenset(("true", "1", "yes", "on", "y", "t"))
+
+
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean environment value."""
+    return value.lower() in _BOOL_TRUE
+
+
+def _find_dotenv() -> str | None:
+    """
+    Find the nearest .env file, searching upward from this package.
+    
+    This matches where ``load_dotenv()`` looks when called from here, so
+    the repository's .env is found whatever the working directory is,
+    without importing python-dotenv when there is no file to load.
+    """
+    directory = os.path.dirname(os.path.abspath(__file__))
+    while True:
+        candidate = os.path.join(directory, ".env")
+        if os.path.isfile(candidate):
+            return candidate
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return None
+        directory = parent
+
+
+# Only touch python-dotenv when a .env file exists; set MCPBASE_USE_DOTENV to
+# a false value (e.g. 0) to skip the lookup entirely
+_DOTENV_PATH = _find_dotenv() if _parse_bool(os.environ.get("MCPBASE_USE_DOTENV", "1")) else None
+if _DOTENV_PATH:
+    try:
+        from dotenv import load_dotenv
+        load_dotenv(_DOTENV_PATH, override=False)  # Load .env file
+    except ImportError:
+        pass  # dotenv not available, use environment variables directly
+
+
+# Process environment, read by the helpers and the override sweep below
+_env = os.environ
 
 
 def get_env_bool(key: str, default: bool = False) -> bool:
     """Get boolean value from environment variable."""
-    value = os.getenv(key, str(default)).lower()
-    return value in ('true', '1', 'yes', 'on')
+    value = _env.get(key)
+    return default if value is None else _parse_bool(value)
 
 
 def get_env_int(key: str, default: int = 0) -> int:
     """Get integer value from environment variable."""
     try:
-        return int(os.getenv(key, str(default)))
-    except ValueError:
+        return int(_env[key])
+    except (KeyError, ValueError):
         return default
+
+
+def _env_overrides(fields: dict[str, tuple[str, Callable[[str], Any]]]) -> dict[str, Any]:
+    """
+    Collect dataclass field overrides from the environment in a single pass.
     
+    Only variables that are actually set produce an override, so unset or
+    malformed values fall back to the dataclass defaults.
+    
+    Args:
+        fields: Mapping of field name -> (environment variable, parser)
+        
+    Returns:
+        dict[str, Any]: Keyword arguments for the dataclass constructor
+    """
+    overrides = {}
+    for field_name, (key, parse) in fields.items():
+        value = _env.get(key)
+        if value is None:
+            continue
+        try:
+            overrides[field_name] = parse(value)
+        except ValueError:
+            pass  # Keep the default for malformed values
+    return overrides
+
+
 @dataclass
 class ServerConfig:
     """Server configuration settings."""
@@ -74,37 +140,42 @@ class EnvironmentConfig:
     enable_logging: bool = True
 
 
-# Create configuration instances with environment variable overrides
-SERVER_CONFIG = ServerConfig(
-    name=os.getenv('MCPBASE_SERVER_NAME', 'MCPBase Server'),
-    version=os.getenv('MCPBASE_SERVER_VERSION', '1.0.0'),
-    description=os.getenv('MCPBASE_SERVER_DESCRIPTION', 'A minimal yet structured MCP base server'),
+# Environment variables that override each configuration field
+_SERVER_ENV_FIELDS = {
+    "name": ("MCPBASE_SERVER_NAME", str),
+    "version": ("MCPBASE_SERVER_VERSION", str),
+    "description": ("MCPBASE_SERVER_DESCRIPTION", str),
     
-    default_host=os.getenv('MCPBASE_DEFAULT_HOST', '0.0.0.0'),
-    default_http_port=get_env_int('MCPBASE_DEFAULT_HTTP_PORT', 8000),
-    default_sse_port=get_env_int('MCPBASE_DEFAULT_SSE_PORT', 8000),
+    "default_host": ("MCPBASE_DEFAULT_HOST", str),
+    "default_http_port": ("MCPBASE_DEFAULT_HTTP_PORT", int),
+    "default_sse_port": ("MCPBASE_DEFAULT_SSE_PORT", int),
     
-    protocol_version=os.getenv('MCPBASE_PROTOCOL_VERSION', '2024-11-05'),
+    "protocol_version": ("MCPBASE_PROTOCOL_VERSION", str),
     
-    log_level=os.getenv('MCPBASE_LOG_LEVEL', 'INFO'),
-    log_format=os.getenv('MCPBASE_LOG_FORMAT', '%(asctime)s - %(name)s - %(levelname)s - %(message)s'),
+    "log_level": ("MCPBASE_LOG_LEVEL", str),
+    "log_format": ("MCPBASE_LOG_FORMAT", str),
     
-    default_transport=os.getenv('MCPBASE_DEFAULT_TRANSPORT', 'stdio'),
-    sse_mount_path=os.getenv('MCPBASE_SSE_MOUNT_PATH', '/sse'),
+    "default_transport": ("MCPBASE_DEFAULT_TRANSPORT", str),
+    "sse_mount_path": ("MCPBASE_SSE_MOUNT_PATH", str),
     
-    enable_kv_store=get_env_bool('MCPBASE_ENABLE_KV_STORE', True),
-    kv_store_uri=os.getenv('MCPBASE_KV_STORE_URI', 'kv://store')
-)
+    "enable_kv_store": ("MCPBASE_ENABLE_KV_STORE", _parse_bool),
+    "kv_store_uri": ("MCPBASE_KV_STORE_URI", str)
+}
 
-ENV_CONFIG = EnvironmentConfig(
-    debug=get_env_bool('MCPBASE_DEBUG', False),
-    reload=get_env_bool('MCPBASE_RELOAD', False),
-    enable_fastapi=get_env_bool('MCPBASE_ENABLE_FASTAPI', True),
-    enable_logging=get_env_bool('MCPBASE_ENABLE_LOGGING', True)
-)
+_ENVIRONMENT_ENV_FIELDS = {
+    "debug": ("MCPBASE_DEBUG", _parse_bool),
+    "reload": ("MCPBASE_RELOAD", _parse_bool),
+    "enable_fastapi": ("MCPBASE_ENABLE_FASTAPI", _parse_bool),
+    "enable_logging": ("MCPBASE_ENABLE_LOGGING", _parse_bool)
+}
+
+# Create configuration instances with environment variable overrides
+SERVER_CONFIG = ServerConfig(**_env_overrides(_SERVER_ENV_FIELDS))
+
+ENV_CONFIG = EnvironmentConfig(**_env_overrides(_ENVIRONMENT_ENV_FIELDS))
 
 # Initial KV store data
-DEFAULT_KV_DATA: Dict[str, Any] = {
+DEFAULT_KV_DATA: dict[str, Any] = {
     "example_key": "example_value",
     "server_started": datetime.now().isoformat(),
     "counter": 0,
@@ -114,46 +185,75 @@ DEFAULT_KV_DATA: Dict[str, Any] = {
     }
 }
 
+class ToolEntry(NamedTuple):
+    """Registry entry describing a lazily imported tool implementation."""
+    
+    name: str
+    description: str
+    module: str
+    function: str
+
+
+class PromptEntry(NamedTuple):
+    """Registry entry describing a lazily imported prompt implementation."""
+    
+    name: str
+    description: str
+    module: str
+    function: str
+
+
+class ResourceEntry(NamedTuple):
+    """Registry entry describing a resource and the class that backs it."""
+    
+    uri: str
+    name: str
+    description: str
+    mime_type: str
+    module: str
+    class_name: str
+
+
 # Tool registry configuration
-TOOL_REGISTRY = {
-    "echo": {
-        "name": "tools.echo",
-        "description": "Echo back the provided message",
-        "module": "mcpbase.tools.basic_tools",
-        "function": "echo_tool"
-    },
-    "reverse": {
-        "name": "tools.reverse", 
-        "description": "Reverse the provided text",
-        "module": "mcpbase.tools.basic_tools",
-        "function": "reverse_tool"
-    },
-    "calculator": {
-        "name": "tools.calculator",
-        "description": "Perform basic arithmetic operations",
-        "module": "mcpbase.tools.math_tools",
-        "function": "calculator_tool"
-    }
-}
+TOOL_REGISTRY: Mapping[str, ToolEntry] = MappingProxyType({
+    "echo": ToolEntry(
+        name="tools.echo",
+        description="Echo back the provided message",
+        module="mcpbase.tools.basic_tools",
+        function="echo_tool"
+    ),
+    "reverse": ToolEntry(
+        name="tools.reverse",
+        description="Reverse the provided text",
+        module="mcpbase.tools.basic_tools",
+        function="reverse_tool"
+    ),
+    "calculator": ToolEntry(
+        name="tools.calculator",
+        description="Perform basic arithmetic operations",
+        module="mcpbase.tools.math_tools",
+        function="calculator_tool"
+    )
+})
 
 # Prompt registry configuration
-PROMPT_REGISTRY = {
-    "code_review": {
-        "name": "code_review",
-        "description": "Generate a code review prompt template",
-        "module": "mcpbase.prompts.development_prompts",
-        "function": "code_review_prompt"
-    }
-}
+PROMPT_REGISTRY: Mapping[str, PromptEntry] = MappingProxyType({
+    "code_review": PromptEntry(
+        name="code_review",
+        description="Generate a code review prompt template",
+        module="mcpbase.prompts.development_prompts",
+        function="code_review_prompt"
+    )
+})
 
 # Resource registry configuration
-RESOURCE_REGISTRY = {
-    "kv_store": {
-        "uri": SERVER_CONFIG.kv_store_uri,
-        "name": "Key-Value Store",
-        "description": "In-memory key-value store with get/set/list operations",
-        "mime_type": "application/json",
-        "module": "mcpbase.utils.resources",
-        "class": "KeyValueStore"
-    }
-}
+RESOURCE_REGISTRY: Mapping[str, ResourceEntry] = MappingProxyType({
+    "kv_store": ResourceEntry(
+        uri=SERVER_CONFIG.kv_store_uri,
+        name="Key-Value Store",
+        description="In-memory key-value store with get/set/list operations",
+        mime_type="application/json",
+        module="mcpbase.utils.resources",
+        class_name="KeyValueStore"
+    )
+})
\ No newline at end of file
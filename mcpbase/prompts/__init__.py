@@ -3,10 +3,27 @@ Prompts Module for MCPBase
 ==========================
 
 Contains all MCP prompt implementations organized by category.
+Prompt functions are imported lazily on first attribute access.
 """
 
-from .development_prompts import code_review_prompt
+from importlib import import_module
+
+# Map of exported prompt name -> submodule that implements it
+_LAZY_EXPORTS = {
+    "code_review_prompt": ".development_prompts"
+}
 
 __all__ = [
     "code_review_prompt"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str):
+    """Import prompt implementations on first access (PEP 562)."""
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
\ No newline at end of file
@@ -6,57 +6,23 @@ Contains prompts for software development tasks like code review,
 documentation generation, and code analysis.
 """
 
+import logging
 from datetime import datetime
 from ..utils.logging_setup import get_logger
 
 logger = get_logger("prompts.development")
 
+# Bound once so each prompt skips the datetime attribute lookup
+_now = datetime.now
 
-async def code_review_prompt(
-    code: str = "# Your code here",
-    language: str = "python", 
-    focus: str = "general"
-) -> str:
-    """
-    Generate a comprehensive code review prompt template.
-    
-    Creates a structured code review request with the provided code,
-    language context, and specific focus areas for review.
-    
-    Args:
-        code: The source code to be reviewed
-        language: Programming language of the code (default: "python")
-        focus: Specific focus area for the review (default: "general")
-               Examples: "security", "performance", "readability", "best-practices"
-    
-    Returns:
-        Formatted code review prompt as a string
-        
-    Example:
-        >>> prompt = await code_review_prompt(
-        ...     code="def hello(): print('world')",
-        ...     language="python",
-        ...     focus="best-practices"
-        ... )
-    """
-    logger.info(f"Generating code review prompt for {language} code, focus: {focus}")
-    
-    # Determine language-specific guidelines
-    language_guidelines = _get_language_guidelines(language)
-    
-    # Create focus-specific checklist items
-    focus_items = _get_focus_checklist(focus, language)
-    
-    # Generate the complete prompt
-    prompt_template = f"""# Code Review Request
-
-## Code to Review ({language.title()})
-```{language}
-{code}
+# Static segments of the code review prompt, joined with the per-call values
+_PROMPT_FOCUS_HEADER = """
 ```
 
 ## Review Focus
-**Primary Focus:** {focus.title()}
+**Primary Focus:** """
+
+_PROMPT_GENERAL_CHECKLIST = """
 
 ## Code Analysis Checklist
 
@@ -66,11 +32,9 @@ async def code_review_prompt(
 - Comment quality and documentation
 - Code structure and organization
 
-### {focus.title()} Focus
-{focus_items}
+### """
 
-### {language.title()}-Specific Considerations
-{language_guidelines}
+_PROMPT_REVIEW_GUIDELINES = """
 
 ## Detailed Review Guidelines
 
@@ -97,15 +61,16 @@ Please provide a thorough review covering:
    - Review authentication and authorization
 
 5. **Best Practices Compliance**
-   - Adherence to {language} coding standards
+   - Adherence to """
+
+_PROMPT_CONTEXT_HEADER = """ coding standards
    - Use of appropriate design patterns
    - Consistency with team conventions
 
 ## Additional Context
-- **Language:** {language}
-- **Focus Area:** {focus}
-- **Review Generated:** {datetime.now().isoformat()}
-- **Code Length:** {len(code)} characters
+- **Language:** """
+
+_PROMPT_OUTPUT_FORMAT = """ characters
 
 ## Review Output Format
 Please structure your review with:
@@ -115,99 +80,168 @@ Please structure your review with:
 - Suggested improvements with code examples
 """
 
-    logger.debug(f"Generated code review prompt ({len(prompt_template)} characters)")
-    return prompt_template
-
-
-def _get_language_guidelines(language: str) -> str:
-    """Get language-specific review guidelines."""
-    guidelines = {
-        "python": """- PEP 8 compliance (formatting, naming)
+# Language-specific review guidelines, keyed by lowercase language name
+_LANGUAGE_GUIDELINES = {
+    "python": """- PEP 8 compliance (formatting, naming)
 - Proper use of Python idioms and features
 - Type hints usage and correctness
 - Exception handling best practices
 - Use of context managers where appropriate
 - List comprehensions vs loops optimization""",
-        
-        "javascript": """- ESLint compliance and modern ES6+ usage
+    
+    "javascript": """- ESLint compliance and modern ES6+ usage
 - Proper async/await vs Promise usage
 - Variable scoping (let/const vs var)
 - Function declaration best practices
 - Error handling with try/catch
 - Memory leak prevention""",
-        
-        "typescript": """- Type safety and proper type annotations
+    
+    "typescript": """- Type safety and proper type annotations
 - Interface vs type alias usage
 - Generic type usage and constraints
 - Strict mode compliance
 - Proper import/export patterns
 - Null safety and optional chaining""",
-        
-        "java": """- Java coding conventions compliance
+    
+    "java": """- Java coding conventions compliance
 - Proper use of access modifiers
 - Exception handling hierarchy
 - Resource management (try-with-resources)
 - Collection framework usage
 - Thread safety considerations""",
-        
-        "rust": """- Memory safety without garbage collection
+    
+    "rust": """- Memory safety without garbage collection
 - Ownership and borrowing rules compliance
 - Error handling with Result types
 - Pattern matching usage
 - Lifetime annotations correctness
 - Performance and zero-cost abstractions"""
-    }
-    
-    return guidelines.get(language.lower(), """- Language-specific best practices
+}
+
+_DEFAULT_LANGUAGE_GUIDELINES = """- Language-specific best practices
 - Standard library usage
 - Error handling patterns
 - Performance considerations
 - Security best practices
-- Code maintainability""")
+- Code maintainability"""
 
-
-def _get_focus_checklist(focus: str, language: str) -> str:
-    """Get focus-specific checklist items."""
-    focus_checklists = {
-        "security": """- Input validation and sanitization
+# Focus-specific checklists, keyed by lowercase focus name
+_FOCUS_CHECKLISTS = {
+    "security": """- Input validation and sanitization
 - Authentication and authorization checks
 - SQL injection and XSS prevention
 - Sensitive data handling
 - Cryptographic implementation review
 - Access control verification""",
-        
-        "performance": """- Algorithm complexity analysis
+    
+    "performance": """- Algorithm complexity analysis
 - Memory usage optimization
 - I/O operation efficiency
 - Caching strategies implementation
 - Database query optimization
 - Resource cleanup and management""",
-        
-        "readability": """- Clear variable and function naming
+    
+    "readability": """- Clear variable and function naming
 - Appropriate code comments
 - Logical code organization
 - Consistent formatting and style
 - Self-documenting code practices
 - Complexity reduction opportunities""",
-        
-        "best-practices": f"""- {language} idioms and conventions
-- Design pattern implementation
-- SOLID principles adherence
-- DRY (Don't Repeat Yourself) compliance
-- Separation of concerns
-- Testability and modularity""",
-        
-        "maintainability": """- Code modularity and reusability
+    
+    "maintainability": """- Code modularity and reusability
 - Clear separation of concerns
 - Documentation completeness
 - Test coverage adequacy
 - Refactoring opportunities
 - Technical debt assessment"""
-    }
-    
-    return focus_checklists.get(focus.lower(), """- General code quality
+}
+
+# The best-practices checklist mentions the language, so it is formatted per call
+_BEST_PRACTICES_CHECKLIST = """- {language} idioms and conventions
+- Design pattern implementation
+- SOLID principles adherence
+- DRY (Don't Repeat Yourself) compliance
+- Separation of concerns
+- Testability and modularity"""
+
+_DEFAULT_FOCUS_CHECKLIST = """- General code quality
 - Logic correctness
 - Error handling
 - Documentation quality
 - Maintainability aspects
-- Performance considerations""")
\ No newline at end of file
+- Performance considerations"""
+
+
+async def code_review_prompt(
+    code: str = "# Your code here",
+    language: str = "python", 
+    focus: str = "general"
+) -> str:
+    """
+    Generate a comprehensive code review prompt template.
+    
+    Creates a structured code review request with the provided code,
+    language context, and specific focus areas for review.
+    
+    Args:
+        code: The source code to be reviewed
+        language: Programming language of the code (default: "python")
+        focus: Specific focus area for the review (default: "general")
+               Examples: "security", "performance", "readability", "best-practices"
+    
+    Returns:
+        Formatted code review prompt as a string
+        
+    Example:
+        >>> prompt = await code_review_prompt(
+        ...     code="def hello(): print('world')",
+        ...     language="python",
+        ...     focus="best-practices"
+        ... )
+    """
+    logger.info("Generating code review prompt for %s code, focus: %s", language, focus)
+    
+    # Determine language-specific guidelines
+    language_guidelines = _get_language_guidelines(language)
+    
+    # Create focus-specific checklist items
+    focus_items = _get_focus_checklist(focus, language)
+    
+    language_title = language.title()
+    focus_title = focus.title()
+    generated_at = _now().isoformat()
+    code_length = str(len(code))
+    
+    # Generate the complete prompt from the precomputed template segments
+    prompt_template = "".join((
+        "# Code Review Request\n\n## Code to Review (", language_title, ")\n```", language, "\n",
+        code,
+        _PROMPT_FOCUS_HEADER, focus_title,
+        _PROMPT_GENERAL_CHECKLIST, focus_title, " Focus\n",
+        focus_items,
+        "\n\n### ", language_title, "-Specific Considerations\n",
+        language_guidelines,
+        _PROMPT_REVIEW_GUIDELINES, language,
+        _PROMPT_CONTEXT_HEADER, language,
+        "\n- **Focus Area:** ", focus,
+        "\n- **Review Generated:** ", generated_at,
+        "\n- **Code Length:** ", code_length,
+        _PROMPT_OUTPUT_FORMAT
+    ))
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Generated code review prompt (%d characters)", len(prompt_template))
+    return prompt_template
+
+
+def _get_language_guidelines(language: str) -> str:
+    """Get language-specific review guidelines."""
+    return _LANGUAGE_GUIDELINES.get(language.lower(), _DEFAULT_LANGUAGE_GUIDELINES)
+
+
+def _get_focus_checklist(focus: str, language: str) -> str:
+    """Get focus-specific checklist items."""
+    focus_key = focus.lower()
+    if focus_key == "best-practices":
+        return _BEST_PRACTICES_CHECKLIST.format(language=language)
+    return _FOCUS_CHECKLISTS.get(focus_key, _DEFAULT_FOCUS_CHECKLIST)
\ No newline at end of file
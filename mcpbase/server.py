@@ -6,19 +6,89 @@ Main server module that orchestrates all components of the MCPBase server.
 Simplified to use FastMCP's native capabilities for all transports.
 """
 
-from typing import Dict, Any
+from collections.abc import Callable, Mapping
+from importlib import import_module
+from typing import Any, Dict
 
-from .config import SERVER_CONFIG
+from .config import SERVER_CONFIG, TOOL_REGISTRY, PROMPT_REGISTRY
 from .utils.logging_setup import setup_logging
 from .utils.mcp_backends import get_mcp_imports
 from .utils.resources import KeyValueStore
-from .tools import echo_tool, reverse_tool, calculator_tool
-from .prompts import code_review_prompt
 
 # Setup logging
 logger = setup_logging()
 
 
+# Implementations resolved so far, keyed by registry name
+_TOOL_IMPLS: dict[str, Callable] = {}
+_PROMPT_IMPLS: dict[str, Callable] = {}
+
+
+def _resolve(registry: Mapping[str, Any], impls: dict[str, Callable], key: str) -> Callable:
+    """
+    Import a registered tool or prompt implementation on first use.
+    
+    The result is stored in ``impls`` so later calls skip the registry
+    lookup and import entirely.
+    
+    Args:
+        registry: Registry holding the entry (TOOL_REGISTRY or PROMPT_REGISTRY)
+        impls: Cache of resolved implementations for that registry
+        key: Registry key of the tool or prompt
+        
+    Returns:
+        Callable: The resolved implementation
+    """
+    entry = registry[key]
+    impl = impls[key] = getattr(import_module(entry.module), entry.function)
+    return impl
+
+
+# Module-level handlers are shared by every server instance, so registering
+# them does not build new closures. Implementations are imported lazily from
+# the registries on first call and cached in _TOOL_IMPLS/_PROMPT_IMPLS. Each
+# handler is named after its registry key, since FastMCP also titles the
+# published schemas after the function name.
+#
+# FastMCP derives each tool's output schema from its return annotation, and
+# ``Dict[str, Any]`` is published differently from ``dict[str, Any]`` (wrapped
+# in a ``result`` field), so these keep ``typing.Dict`` to stay wire-compatible.
+
+async def echo(message: str) -> Dict[str, Any]:
+    """Echo back the provided message."""
+    impl = _TOOL_IMPLS.get("echo") or _resolve(TOOL_REGISTRY, _TOOL_IMPLS, "echo")
+    return await impl(message)
+
+
+async def reverse(text: str) -> Dict[str, Any]:
+    """Reverse the provided text."""
+    impl = _TOOL_IMPLS.get("reverse") or _resolve(TOOL_REGISTRY, _TOOL_IMPLS, "reverse")
+    return await impl(text)
+
+
+async def calculator(operation: str, a: float, b: float) -> Dict[str, Any]:
+    """Perform basic arithmetic operations (add, subtract, multiply, divide)."""
+    impl = _TOOL_IMPLS.get("calculator") or _resolve(TOOL_REGISTRY, _TOOL_IMPLS, "calculator")
+    return await impl(operation, a, b)
+
+
+async def code_review(
+    code: str = "# Your code here",
+    language: str = "python", 
+    focus: str = "general"
+) -> str:
+    """Generate a comprehensive code review prompt template."""
+    impl = _PROMPT_IMPLS.get("code_review") or _resolve(PROMPT_REGISTRY, _PROMPT_IMPLS, "code_review")
+    return await impl(code, language, focus)
+
+
+# Handlers keyed by the name they are exposed under via MCP, built from the
+# registries so every entry needs a matching handler above
+_TOOL_HANDLERS = {name: globals()[name] for name in TOOL_REGISTRY}
+
+_PROMPT_HANDLERS = {name: globals()[name] for name in PROMPT_REGISTRY}
+
+
 class MCPBaseServer:
     """
     Simplified MCP server using FastMCP's native capabilities.
@@ -56,22 +126,10 @@ class MCPBaseServer:
         """Register tools using FastMCP decorators."""
         logger.info("Registering tools...")
         
-        @self.server.tool()
-        async def echo(message: str) -> Dict[str, Any]:
-            """Echo back the provided message."""
-            return await echo_tool(message)
-        
-        @self.server.tool()
-        async def reverse(text: str) -> Dict[str, Any]:
-            """Reverse the provided text."""
-            return await reverse_tool(text)
-        
-        @self.server.tool()
-        async def calculator(operation: str, a: float, b: float) -> Dict[str, Any]:
-            """Perform basic arithmetic operations (add, subtract, multiply, divide)."""
-            return await calculator_tool(operation, a, b)
+        for name, handler in _TOOL_HANDLERS.items():
+            self.server.tool(name=name)(handler)
         
-        logger.info("Registered 3 tools: echo, reverse, calculator")
+        logger.info(f"Registered {len(_TOOL_HANDLERS)} tools: {', '.join(_TOOL_HANDLERS)}")
     
     def _register_resources(self):
         """Register resources using FastMCP decorators."""
@@ -88,16 +146,10 @@ class MCPBaseServer:
         """Register prompts using FastMCP decorators."""
         logger.info("Registering prompts...")
         
-        @self.server.prompt()
-        async def code_review(
-            code: str = "# Your code here",
-            language: str = "python", 
-            focus: str = "general"
-        ) -> str:
-            """Generate a comprehensive code review prompt template."""
-            return await code_review_prompt(code, language, focus)
+        for name, handler in _PROMPT_HANDLERS.items():
+            self.server.prompt(name=name)(handler)
         
-        logger.info("Registered 1 prompt: code_review")
+        logger.info(f"Registered {len(_PROMPT_HANDLERS)} prompt: {', '.join(_PROMPT_HANDLERS)}")
     
     def run(self, transport: str = "stdio"):
         """
@@ -3,13 +3,31 @@ Tools Module for MCPBase
 ========================
 
 Contains all MCP tool implementations organized by category.
+Tool functions are imported lazily on first attribute access.
 """
 
-from .basic_tools import echo_tool, reverse_tool
-from .math_tools import calculator_tool
+from importlib import import_module
+
+# Map of exported tool name -> submodule that implements it
+_LAZY_EXPORTS = {
+    "echo_tool": ".basic_tools",
+    "reverse_tool": ".basic_tools",
+    "calculator_tool": ".math_tools"
+}
 
 __all__ = [
     "echo_tool",
     "reverse_tool", 
     "calculator_tool"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str):
+    """Import tool implementations on first access (PEP 562)."""
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
\ No newline at end of file
@@ -5,15 +5,42 @@ Basic Tools Implementation
 Contains basic utility tools for text processing and echo functionality.
 """
 
-from typing import Dict, Any
-from datetime import datetime
-from ..utils.validation import ToolResult
+from __future__ import annotations
+
+from time import localtime, strftime, time_ns
+from typing import Any
 from ..utils.logging_setup import get_logger
 
 logger = get_logger("tools.basic")
 
+# (epoch second, formatted "YYYY-MM-DDTHH:MM:SS") of the last timestamp built
+_timestamp_cache = (-1, "")
+
 
-async def echo_tool(message: str) -> Dict[str, Any]:
+def _iso_now() -> str:
+    """
+    Get the current local time as an ISO 8601 string.
+    
+    Matches ``datetime.now().isoformat()``, including leaving off the
+    fraction when the microseconds are zero, but only re-formats the date
+    and time part when the wall-clock second changes.
+    
+    Returns:
+        str: Timestamp with microsecond precision
+    """
+    global _timestamp_cache
+    
+    seconds, nanos = divmod(time_ns(), 1_000_000_000)
+    cached_second, prefix = _timestamp_cache
+    if seconds != cached_second:
+        prefix = strftime("%Y-%m-%dT%H:%M:%S", localtime(seconds))
+        _timestamp_cache = (seconds, prefix)
+    
+    micros = nanos // 1000
+    return f"{prefix}.{micros:06d}" if micros else prefix
+
+
+async def echo_tool(message: str) -> dict[str, Any]:
     """
     Echo back the provided message with timestamp.
     
@@ -34,35 +61,29 @@ async def echo_tool(message: str) -> Dict[str, Any]:
             "metadata": {"timestamp": "2025-10-26T..."}
         }
     """
-    logger.info(f"Echo tool called with message: {message}")
+    logger.info("Echo tool called with message: %s", message)
     
     try:
-        result = ToolResult.success(
-            result=f"Echo: {message}",
-            metadata={
-                "timestamp": datetime.now().isoformat(),
+        return {
+            "status": "success",
+            "result": f"Echo: {message}",
+            "metadata": {
+                "timestamp": _iso_now(),
                 "original_message": message,
                 "message_length": len(message)
             }
-        )
-        
-        return {
-            "status": result.status,
-            "result": result.result,
-            "metadata": result.metadata
         }
         
     except Exception as e:
-        logger.error(f"Echo tool error: {e}")
-        error_result = ToolResult.error(f"Failed to echo message: {str(e)}")
+        logger.error("Echo tool error: %s", e)
         return {
-            "status": error_result.status,
-            "result": error_result.result,
-            "error": error_result.error
+            "status": "error",
+            "result": None,
+            "error": f"Failed to echo message: {str(e)}"
         }
 
 
-async def reverse_tool(text: str) -> Dict[str, Any]:
+async def reverse_tool(text: str) -> dict[str, Any]:
     """
     Reverse the provided text string.
     
@@ -86,44 +107,35 @@ async def reverse_tool(text: str) -> Dict[str, Any]:
             "metadata": {"original_length": 5}
         }
     """
-    logger.info(f"Reverse tool called with text: {text}")
+    logger.info("Reverse tool called with text: %s", text)
     
     try:
         # Validate input type
         if not isinstance(text, str):
-            error_result = ToolResult.error(
-                f"Input must be a string, got {type(text).__name__}"
-            )
             return {
-                "status": error_result.status,
-                "result": error_result.result,
-                "error": error_result.error
+                "status": "error",
+                "result": None,
+                "error": f"Input must be a string, got {type(text).__name__}"
             }
         
         # Perform the reversal
         reversed_text = text[::-1]
         
-        result = ToolResult.success(
-            result=reversed_text,
-            metadata={
+        return {
+            "status": "success",
+            "result": reversed_text,
+            "metadata": {
                 "original_text": text,
                 "original_length": len(text),
                 "reversed_length": len(reversed_text),
                 "operation": "string_reverse"
             }
-        )
-        
-        return {
-            "status": result.status,
-            "result": result.result,
-            "metadata": result.metadata
         }
         
     except Exception as e:
-        logger.error(f"Reverse tool error: {e}")
-        error_result = ToolResult.error(f"Failed to reverse text: {str(e)}")
+        logger.error("Reverse tool error: %s", e)
         return {
-            "status": error_result.status,
-            "result": error_result.result,
-            "error": error_result.error
+            "status": "error",
+            "result": None,
+            "error": f"Failed to reverse text: {str(e)}"
         }
\ No newline at end of file
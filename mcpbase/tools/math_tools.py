@@ -5,18 +5,31 @@ Mathematical Tools Implementation
 Contains mathematical computation tools including basic arithmetic operations.
 """
 
-from typing import Dict, Any, Union
-from ..utils.validation import ToolResult
+from __future__ import annotations
+
+import operator
+from typing import Any
 from ..utils.logging_setup import get_logger
 
 logger = get_logger("tools.math")
 
+# Supported operations mapped to their implementations
+_OPS = {
+    "add": operator.add,
+    "subtract": operator.sub,
+    "multiply": operator.mul,
+    "divide": operator.truediv
+}
+
+# Operand types accepted by the calculator
+_NUMBER_TYPES = (int, float)
+
 
 async def calculator_tool(
     operation: str, 
-    a: Union[int, float], 
-    b: Union[int, float]
-) -> Dict[str, Any]:
+    a: int | float, 
+    b: int | float
+) -> dict[str, Any]:
     """
     Perform basic arithmetic operations on two numbers.
     
@@ -44,73 +57,59 @@ async def calculator_tool(
             "metadata": {"operation": "5 add 3 = 8"}
         }
     """
-    logger.info(f"Calculator tool called: {a} {operation} {b}")
+    logger.info("Calculator tool called: %s %s %s", a, operation, b)
     
     try:
         # Validate operation type
-        valid_operations = ["add", "subtract", "multiply", "divide"]
-        if operation not in valid_operations:
-            error_result = ToolResult.error(
-                f"Unknown operation '{operation}'. "
-                f"Valid operations: {', '.join(valid_operations)}"
-            )
+        op = _OPS.get(operation)
+        if op is None:
+            return {
+                "status": "error",
+                "result": None,
+                "error": (
+                    f"Unknown operation '{operation}'. "
+                    f"Valid operations: {', '.join(_OPS)}"
+                )
+            }
+        
+        # Validate number types (direct callers bypass FastMCP's validation)
+        if not isinstance(a, _NUMBER_TYPES) or not isinstance(b, _NUMBER_TYPES):
             return {
-                "status": error_result.status,
-                "result": error_result.result,
-                "error": error_result.error
+                "status": "error",
+                "result": None,
+                "error": (
+                    "Both operands must be numbers. "
+                    f"Got {type(a).__name__} and {type(b).__name__}"
+                )
             }
         
-        # Validate number types
-        if not isinstance(a, (int, float)) or not isinstance(b, (int, float)):
-            error_result = ToolResult.error(
-                f"Both operands must be numbers. Got {type(a).__name__} and {type(b).__name__}"
-            )
+        if operation == "divide" and b == 0:
             return {
-                "status": error_result.status,
-                "result": error_result.result,
-                "error": error_result.error
+                "status": "error",
+                "result": None,
+                "error": "Division by zero is not allowed"
             }
         
         # Perform the calculation
-        if operation == "add":
-            calc_result = a + b
-        elif operation == "subtract":
-            calc_result = a - b
-        elif operation == "multiply":
-            calc_result = a * b
-        elif operation == "divide":
-            if b == 0:
-                error_result = ToolResult.error("Division by zero is not allowed")
-                return {
-                    "status": error_result.status,
-                    "result": error_result.result,
-                    "error": error_result.error
-                }
-            calc_result = a / b
+        calc_result = op(a, b)
         
         # Create success result with metadata
-        result = ToolResult.success(
-            result=calc_result,
-            metadata={
+        return {
+            "status": "success",
+            "result": calc_result,
+            "metadata": {
                 "operation": f"{a} {operation} {b} = {calc_result}",
                 "operand_a": a,
                 "operand_b": b,
                 "operation_type": operation,
                 "result_type": type(calc_result).__name__
             }
-        )
-        
-        return {
-            "status": result.status,
-            "result": result.result,
-            "metadata": result.metadata
         }
         
     except Exception as e:
-        logger.error(f"Calculator tool error: {e}")
-        error_result = ToolResult.error(f"Calculation failed: {str(e)}")
+        logger.error("Calculator tool error: %s", e)
         return {
-            "status": error_result.status,
-            "result": error_result.result,
-            "error": error_result.error
+            "status": "error",
+            "result": None,
+            "error": f"Calculation failed: {str(e)}"
         }
\ No newline at end of file
@@ -10,20 +10,34 @@ import logging
 import sys
 from ..config import SERVER_CONFIG, ENV_CONFIG
 
+# Supported log level names mapped to their numeric values
+_LEVELS = {
+    "CRITICAL": logging.CRITICAL,
+    "ERROR": logging.ERROR,
+    "WARNING": logging.WARNING,
+    "INFO": logging.INFO,
+    "DEBUG": logging.DEBUG
+}
+
 
 def setup_logging() -> logging.Logger:
     """
     Setup logging configuration for the MCPBase server.
     
+    The root handler is only configured once, so repeated calls (e.g. when
+    modules are reloaded in development mode) do not redo handler setup.
+    Unknown log level names fall back to INFO.
+    
     Returns:
         logging.Logger: Configured logger instance
     """
     # Configure basic logging
-    logging.basicConfig(
-        level=getattr(logging, SERVER_CONFIG.log_level),
-        format=SERVER_CONFIG.log_format,
-        stream=sys.stdout
-    )
+    if not logging.getLogger().handlers:
+        logging.basicConfig(
+            level=_LEVELS.get(SERVER_CONFIG.log_level.upper(), logging.INFO),
+            format=SERVER_CONFIG.log_format,
+            stream=sys.stdout
+        )
     
     # Create and return logger for the package
     logger = logging.getLogger("mcpbase")
@@ -5,42 +5,87 @@ MCP Backend Detection and Import Utilities
 Handles detection and importing of different MCP backends (FastMCP vs standard MCP).
 """
 
+from __future__ import annotations
+
+import functools
 import logging
-from typing import Tuple, Optional
+from importlib import import_module
+from importlib.util import find_spec
 
 logger = logging.getLogger("mcpbase.utils.mcp_backends")
 
+# Names that can be imported from this module once their backend is detected
+_MCP_EXPORTS = frozenset(("FastMCP", "Server", "stdio_server", "types"))
+
+# HTTP exports mapped to the package providing them and the attribute to read
+# from it (None for the module itself)
+_HTTP_PACKAGES = ("fastapi", "uvicorn")
+_FASTAPI_EXPORTS = {
+    "FastAPI": ("fastapi", "FastAPI"),
+    "HTTPException": ("fastapi", "HTTPException"),
+    "uvicorn": ("uvicorn", None)
+}
+
+# Detected backend, filled in by the first get_mcp_imports() call
+_MCP_IMPORTS: tuple[str, dict] | None = None
+
+
+def _module_available(name: str) -> bool:
+    """
+    Check whether a module can be found, without importing the module itself.
+    
+    ``find_spec`` on a dotted name does import its parent packages (e.g.
+    ``mcp`` and ``mcp.server`` for ``mcp.server.fastmcp``), so the top-level
+    package is probed first and a parent that fails to import counts as
+    unavailable.
+    """
+    package = name.partition(".")[0]
+    try:
+        return find_spec(package) is not None and find_spec(name) is not None
+    except ImportError:
+        return False
+
 
-def detect_mcp_backend() -> Tuple[str, dict]:
+@functools.cache
+def detect_mcp_backend() -> tuple[str, dict]:
     """
     Detect available MCP backend and return appropriate imports.
     
+    Backends are probed with ``find_spec`` so only the selected backend is
+    imported; if that import still fails, the next backend is tried. The
+    result is cached, so detection runs once.
+    
     Returns:
-        Tuple[str, dict]: Backend name and import dictionary
+        tuple[str, dict]: Backend name and import dictionary
         
     Raises:
         ImportError: If no MCP backend is available
     """
-    try:
-        # Try FastMCP first
-        from mcp.server.fastmcp import FastMCP
-        from mcp.server.stdio import stdio_server
-        
-        imports = {
-            "FastMCP": FastMCP,
-            "stdio_server": stdio_server
-        }
-        
-        logger.info("Using FastMCP backend")
-        return "fastmcp", imports
-        
-    except ImportError:
+    # Try FastMCP first
+    if _module_available("mcp.server.fastmcp"):
+        try:
+            from mcp.server.fastmcp import FastMCP
+            from mcp.server.stdio import stdio_server
+        except ImportError as e:
+            logger.warning("FastMCP is installed but failed to import: %s", e)
+        else:
+            imports = {
+                "FastMCP": FastMCP,
+                "stdio_server": stdio_server
+            }
+            
+            logger.info("Using FastMCP backend")
+            return "fastmcp", imports
+    
+    # Fallback to standard MCP
+    if _module_available("mcp.server"):
         try:
-            # Fallback to standard MCP
             from mcp.server import Server
             from mcp.server.stdio import stdio_server
             from mcp import types
-            
+        except ImportError as e:
+            logger.warning("Standard MCP is installed but failed to import: %s", e)
+        else:
             imports = {
                 "Server": Server,
                 "stdio_server": stdio_server,
@@ -49,48 +94,91 @@ def detect_mcp_backend() -> Tuple[str, dict]:
             
             logger.info("Using standard MCP backend")
             return "standard", imports
-            
-        except ImportError:
-            logger.error("Neither FastMCP nor standard MCP is available")
-            raise ImportError(
-                "No MCP backend available. Please install the 'mcp' package:\n"
-                "pip install mcp"
-            )
+    
+    logger.error("Neither FastMCP nor standard MCP is available")
+    raise ImportError(
+        "No MCP backend available. Please install the 'mcp' package:\n"
+        "pip install mcp"
+    )
 
 
-def get_mcp_imports() -> Tuple[str, dict]:
+def get_mcp_imports() -> tuple[str, dict]:
     """
     Get MCP imports with caching.
     
+    After the first call this is a single module-global read.
+    
     Returns:
-        Tuple[str, dict]: Backend name and imports
+        tuple[str, dict]: Backend name and imports
+    """
+    global _MCP_IMPORTS
+    
+    if _MCP_IMPORTS is None:
+        _MCP_IMPORTS = detect_mcp_backend()
+    return _MCP_IMPORTS
+
+
+@functools.cache
+def check_http_dependencies() -> dict[str, bool]:
     """
-    if not hasattr(get_mcp_imports, "_cache"):
-        get_mcp_imports._cache = detect_mcp_backend()
+    Check which of the optional HTTP packages are installed.
+    
+    Each package is probed separately with ``find_spec``, so nothing is
+    imported. The result is cached.
     
-    return get_mcp_imports._cache
+    Returns:
+        dict[str, bool]: Availability keyed by package name
+    """
+    return {package: _module_available(package) for package in _HTTP_PACKAGES}
 
 
-def check_fastapi_availability() -> Tuple[bool, Optional[dict]]:
+@functools.cache
+def check_fastapi_availability() -> tuple[bool, dict | None]:
     """
     Check if FastAPI and Uvicorn are available.
     
+    The packages are only imported when both are present; otherwise the
+    missing ones are named in the warning. The result is cached.
+    
     Returns:
-        Tuple[bool, Optional[dict]]: Availability status and imports if available
+        tuple[bool, dict | None]: Availability status and imports if available
     """
+    status = check_http_dependencies()
+    missing = [package for package, found in status.items() if not found]
+    if missing:
+        logger.warning(
+            "FastAPI not available (missing: %s). HTTP endpoints will be disabled.",
+            ", ".join(missing)
+        )
+        return False, None
+    
     try:
-        from fastapi import FastAPI, HTTPException
-        import uvicorn
-        
-        imports = {
-            "FastAPI": FastAPI,
-            "HTTPException": HTTPException,
-            "uvicorn": uvicorn
-        }
-        
-        logger.debug("FastAPI is available")
-        return True, imports
-        
-    except ImportError:
-        logger.warning("FastAPI not available. HTTP endpoints will be disabled.")
-        return False, None
\ No newline at end of file
+        imports = {name: __getattr__(name) for name in _FASTAPI_EXPORTS}
+    except ImportError as e:
+        logger.warning("FastAPI failed to import: %s. HTTP endpoints will be disabled.", e)
+        return False, None
+    
+    logger.debug("FastAPI is available")
+    return True, imports
+
+
+def __getattr__(name: str):
+    """
+    Resolve backend objects such as ``FastMCP`` lazily (PEP 562).
+    
+    ``from mcpbase.utils.mcp_backends import FastMCP`` triggers backend
+    detection on first use instead of at module import. ``FastAPI`` and
+    ``uvicorn`` are likewise only imported when first accessed.
+    """
+    if name in _MCP_EXPORTS:
+        _, imports = get_mcp_imports()
+        if name in imports:
+            return imports[name]
+    elif name in _FASTAPI_EXPORTS:
+        # Each name only needs its own package, e.g. HTTPException without uvicorn
+        package, attr = _FASTAPI_EXPORTS[name]
+        if check_http_dependencies()[package]:
+            module = import_module(package)
+            return module if attr is None else getattr(module, attr)
+    
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
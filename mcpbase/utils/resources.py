@@ -5,44 +5,163 @@ Resource Management Utilities
 Contains resource implementations for the MCP server.
 """
 
+from __future__ import annotations
+
 import json
-from typing import Dict, Any, Optional
+import logging
+import sys
+from collections.abc import Iterator, Mapping, MutableMapping
+from types import MappingProxyType
+from typing import Any
 from ..config import DEFAULT_KV_DATA
 from ..utils.logging_setup import get_logger
 
 logger = get_logger("resources")
 
+# Sentinel distinguishing a missing key from a stored None
+_MISSING = object()
+
+# Static parts of the store info
+_KV_DESCRIPTION = "In-memory key-value store"
+_KV_OPERATIONS = ("get", "set", "list", "delete")
+
+try:
+    import orjson
+    
+    def _dumps(obj: Any) -> str:
+        """Serialize to indented JSON using orjson."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    def _dumps(obj: Any) -> str:
+        """Serialize to indented JSON using the standard library."""
+        return json.dumps(obj, indent=2)
+
+
+def _intern_key(key: Any) -> Any:
+    """
+    Intern string keys before they are stored.
+    
+    Lookups with an identical (e.g. literal) key then match on identity
+    inside the dict instead of falling back to a full string comparison.
+    """
+    return sys.intern(key) if type(key) is str else key
+
 
-class KeyValueStore:
+class KeyValueStore(MutableMapping):
     """
     In-memory key-value store resource for MCP server.
     
     Provides get, set, list, and delete operations on a simple
-    key-value data structure.
+    key-value data structure. The store is also a ``MutableMapping``,
+    so ``store[key]``, ``key in store`` and ``len(store)`` work as for
+    a dict; writes go through ``set``/``delete`` either way, and ``data``
+    is a read-only view of the contents.
+    
+    Unlike a dict, stores keep identity semantics: they are hashable,
+    only equal to themselves and truthy even when empty.
     """
     
-    def __init__(self, initial_data: Optional[Dict[str, Any]] = None):
+    __slots__ = (
+        "_data",
+        "_version",
+        "_cached_version",
+        "_info_cache",
+        "_json_cache",
+        "_keys_cache",
+        "_keys_version",
+        "_get",
+        "_set",
+        "_pop"
+    )
+    
+    # Keep object identity semantics rather than the value-based ones
+    # inherited from Mapping (which also sets __hash__ to None)
+    __eq__ = object.__eq__
+    __hash__ = object.__hash__
+    
+    def __init__(self, initial_data: dict[str, Any] | None = None):
         """
         Initialize the key-value store.
         
+        The initial data is copied, so later changes to the caller's dict
+        (or to the module defaults) do not leak into the store.
+        
         Args:
             initial_data: Initial data to populate the store
         """
-        self.data = initial_data.copy() if initial_data else DEFAULT_KV_DATA.copy()
-        logger.debug(f"Initialized KV store with {len(self.data)} items")
+        # Store info and its JSON form are cached against a version counter
+        # that only changes when keys are added or removed
+        self._version = 0
+        self._cached_version = -1
+        self._info_cache: Mapping[str, Any] | None = None
+        self._json_cache: str | None = None
+        self._keys_cache: tuple[str, ...] = ()
+        self._keys_version = -1
+        
+        self.data = initial_data if initial_data else DEFAULT_KV_DATA
+        logger.debug("Initialized KV store with %d items", len(self._data))
+    
+    @property
+    def data(self) -> Mapping[str, Any]:
+        """Read-only view of the stored data; write through ``set``/``delete``."""
+        return MappingProxyType(self._data)
     
-    def get(self, key: str) -> Optional[Any]:
+    @data.setter
+    def data(self, data: Mapping[str, Any]):
+        """Replace the stored data with a copy of ``data``."""
+        self._data = {_intern_key(key): value for key, value in data.items()}
+        self._bind()
+        self._version += 1
+    
+    def _bind(self):
+        """Pre-bind the hot-path methods of the current backing dict."""
+        self._get = self._data.get
+        self._set = self._data.__setitem__
+        self._pop = self._data.pop
+    
+    def __getitem__(self, key: str) -> Any:
+        """Get a value by key, raising KeyError if it is missing."""
+        return self._data[key]
+    
+    def __setitem__(self, key: str, value: Any):
+        """Set a key-value pair (same as ``set``)."""
+        self.set(key, value)
+    
+    def __delitem__(self, key: str):
+        """Delete a key, raising KeyError if it is missing."""
+        if not self.delete(key):
+            raise KeyError(key)
+    
+    def __contains__(self, key: object) -> bool:
+        """Check whether a key is present."""
+        return key in self._data
+    
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the keys."""
+        return iter(self._data)
+    
+    def __len__(self) -> int:
+        """Get the number of stored keys."""
+        return len(self._data)
+    
+    def __bool__(self) -> bool:
+        """A store is always truthy, even when empty."""
+        return True
+    
+    def get(self, key: str, default: Any = None) -> Any | None:
         """
         Get a value by key.
         
         Args:
             key: The key to look up
+            default: Value returned when the key is missing
             
         Returns:
-            The value if found, None otherwise
+            The value if found, ``default`` otherwise
         """
-        value = self.data.get(key)
-        logger.debug(f"KV GET: {key} -> {'found' if value is not None else 'not found'}")
+        value = self._get(key, default)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("KV GET: %s -> %s", key, "found" if value is not None else "not found")
         return value
     
     def set(self, key: str, value: Any) -> bool:
@@ -56,8 +175,12 @@ class KeyValueStore:
         Returns:
             True if successful
         """
-        self.data[key] = value
-        logger.debug(f"KV SET: {key} -> {type(value).__name__}")
+        key = _intern_key(key)
+        if key not in self._data:
+            self._version += 1
+        self._set(key, value)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("KV SET: %s -> %s", key, type(value).__name__)
         return True
     
     def delete(self, key: str) -> bool:
@@ -70,43 +193,66 @@ class KeyValueStore:
         Returns:
             True if key existed and was deleted, False otherwise
         """
-        if key in self.data:
-            del self.data[key]
-            logger.debug(f"KV DELETE: {key} -> deleted")
-            return True
-        logger.debug(f"KV DELETE: {key} -> not found")
-        return False
-    
-    def list_keys(self) -> list[str]:
+        if self._pop(key, _MISSING) is _MISSING:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("KV DELETE: %s -> not found", key)
+            return False
+        self._version += 1
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("KV DELETE: %s -> deleted", key)
+        return True
+    
+    def list_keys(self) -> tuple[str, ...]:
         """
         List all keys in the store.
         
+        The tuple is cached until a key is added or removed; use
+        ``list(store.list_keys())`` if a mutable copy is needed.
+        
         Returns:
-            List of all keys
+            Tuple of all keys
         """
-        keys = list(self.data.keys())
-        logger.debug(f"KV LIST: {len(keys)} keys")
-        return keys
+        if self._keys_version != self._version:
+            self._keys_cache = tuple(self._data)
+            self._keys_version = self._version
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("KV LIST: %d keys", len(self._keys_cache))
+        return self._keys_cache
     
-    def get_info(self) -> Dict[str, Any]:
+    def get_info(self) -> Mapping[str, Any]:
         """
         Get information about the store.
         
+        The result is cached until a key is added or removed. It is a
+        read-only view shared between calls; use ``dict(store.get_info())``
+        if a mutable copy is needed.
+        
         Returns:
-            Dictionary with store information
+            Read-only mapping with store information
         """
-        return {
-            "description": "In-memory key-value store",
-            "operations": ["get", "set", "list", "delete"],
-            "current_keys": self.list_keys(),
-            "count": len(self.data)
-        }
+        if self._cached_version != self._version:
+            self._info_cache = MappingProxyType({
+                "description": _KV_DESCRIPTION,
+                "operations": _KV_OPERATIONS,
+                "current_keys": self.list_keys(),
+                "count": len(self._data)
+            })
+            self._json_cache = None
+            self._cached_version = self._version
+        return self._info_cache
     
     def to_json(self) -> str:
         """
         Convert store info to JSON string.
         
+        The serialized form is cached alongside get_info() and only rebuilt
+        after a key is added or removed, so repeated resource reads skip
+        JSON encoding.
+        
         Returns:
             JSON representation of store info
         """
-        return json.dumps(self.get_info(), indent=2)
\ No newline at end of file
+        info = self.get_info()
+        if self._json_cache is None:
+            self._json_cache = _dumps(dict(info))
+        return self._json_cache
\ No newline at end of file
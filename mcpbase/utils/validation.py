@@ -5,15 +5,26 @@ Validation and Data Classes
 Contains validation classes and data structures used throughout MCPBase.
 """
 
+from __future__ import annotations
+
+import functools
+import sys
 from dataclasses import dataclass
-from typing import Any, Optional
+from typing import Any
+
+# Interned status values, shared by every result
+_SUCCESS = sys.intern("success")
+_ERROR = sys.intern("error")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ToolResult:
     """
     Standardized tool result format for consistent response structure.
     
+    Instances are immutable and use ``__slots__``, so each result is a
+    compact fixed-layout object without a per-instance ``__dict__``.
+    
     Attributes:
         status: Status of the operation ("success", "error")
         result: The actual result data
@@ -22,23 +33,36 @@ class ToolResult:
     """
     status: str
     result: Any
-    error: Optional[str] = None
-    metadata: Optional[dict] = None
+    error: str | None = None
+    metadata: dict | None = None
     
     def is_success(self) -> bool:
         """Check if the result represents a successful operation."""
-        return self.status == "success"
+        return self.status == _SUCCESS
     
     def is_error(self) -> bool:
         """Check if the result represents an error."""
-        return self.status == "error"
+        return self.status == _ERROR
     
     @classmethod
-    def success(cls, result: Any, metadata: Optional[dict] = None) -> "ToolResult":
+    def success(cls, result: Any, metadata: dict | None = None) -> ToolResult:
         """Create a successful result."""
-        return cls(status="success", result=result, metadata=metadata)
+        return cls(status=_SUCCESS, result=result, metadata=metadata)
+    
+    @classmethod
+    def failure(cls, error_msg: str, metadata: dict | None = None) -> ToolResult:
+        """
+        Create an error result.
+        
+        Results are immutable, so errors without metadata are pooled and
+        repeated messages (e.g. validation failures) share one instance.
+        """
+        if metadata is None:
+            return cls._pooled_failure(error_msg)
+        return cls(status=_ERROR, result=None, error=error_msg, metadata=metadata)
     
     @classmethod
-    def error(cls, error_msg: str, metadata: Optional[dict] = None) -> "ToolResult":
-        """Create an error result."""
-        return cls(status="error", result=None, error=error_msg, metadata=metadata)
\ No newline at end of file
+    @functools.lru_cache(maxsize=256)
+    def _pooled_failure(cls, error_msg: str) -> ToolResult:
+        """Create (or reuse) an error result without metadata."""
+        return cls(status=_ERROR, result=None, error=error_msg)
\ No newline at end of file
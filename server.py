@@ -55,14 +55,30 @@ License: MIT
 Version: 1.0.0
 """
 
-import asyncio
+import functools
 import sys
-from mcpbase.server import MCPBaseServer
 from mcpbase.config import SERVER_CONFIG
 from mcpbase.utils.logging_setup import get_logger
 
 logger = get_logger("main")
 
+# Warm the tool and prompt modules up front when running the self-tests
+if "--self-test" in sys.argv:
+    import mcpbase.tools.basic_tools
+    import mcpbase.tools.math_tools
+    import mcpbase.prompts.development_prompts
+
+
+# Flags that print the usage text
+_HELP_FLAGS = frozenset(("--help", "-h"))
+
+
+@functools.cache
+def _build_server():
+    """Build the MCPBaseServer used by the self-tests, once per process."""
+    from mcpbase.server import MCPBaseServer
+    return MCPBaseServer()
+
 
 async def self_test() -> bool:
     """
@@ -77,7 +93,7 @@ async def self_test() -> bool:
     
     try:
         # Test server initialization
-        server = MCPBaseServer()
+        server = _build_server()
         logger.info("✓ Server initialization successful")
         
         # Test KV store operations
@@ -92,18 +108,22 @@ async def self_test() -> bool:
         from mcpbase.tools import echo_tool, reverse_tool, calculator_tool
         logger.info("✓ Tool imports successful")
         
-        # Test tool functionality
-        echo_result = await echo_tool("Hello Test")
+        # Test tool functionality (the tools are independent, so run them concurrently)
+        import asyncio
+        echo_result, reverse_result, calc_result = await asyncio.gather(
+            echo_tool("Hello Test"),
+            reverse_tool("Hello"),
+            calculator_tool("add", 5, 3)
+        )
+        
         assert echo_result["status"] == "success"
         assert "Hello Test" in echo_result["result"]
         logger.info("✓ Echo tool working")
         
-        reverse_result = await reverse_tool("Hello")
         assert reverse_result["status"] == "success"
         assert reverse_result["result"] == "olleH"
         logger.info("✓ Reverse tool working")
         
-        calc_result = await calculator_tool("add", 5, 3)
         assert calc_result["status"] == "success"
         assert calc_result["result"] == 8
         logger.info("✓ Calculator tool working")
@@ -175,16 +195,23 @@ def main():
     
     Handles command line arguments and starts the appropriate server mode.
     """
+    # Parse the command line flags once
+    args = frozenset(sys.argv[1:])
+    
     # Handle help flags
-    if "--help" in sys.argv or "-h" in sys.argv:
+    if args & _HELP_FLAGS:
         print_usage()
         sys.exit(0)
     
     # Handle self-test flag
-    if "--self-test" in sys.argv:
+    if "--self-test" in args:
+        import asyncio
         success = asyncio.run(self_test())
         sys.exit(0 if success else 1)
     
+    # Server and MCP backend imports are deferred past the help/self-test paths
+    from mcpbase.server import MCPBaseServer
+    
     # Initialize server
     try:
         server = MCPBaseServer()
@@ -194,12 +221,12 @@ def main():
     
     # Determine and start server mode using FastMCP's simple run method
     try:
-        if "--http" in sys.argv:
+        if "--http" in args:
             logger.info("Starting HTTP mode...")
             # For HTTP testing, we can use FastMCP dev mode or custom HTTP server
             logger.warning("HTTP mode deprecated - use --sse for VS Code or stdio for Claude Desktop")
             server.run("stdio")  # Fallback to stdio
-        elif "--sse" in sys.argv:
+        elif "--sse" in args:
             logger.info("Starting SSE mode...")
             server.run("sse")
         else: